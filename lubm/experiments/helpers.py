@@ -1,9 +1,14 @@
 import os
-from typing import List, Any, Tuple
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Any, Tuple, Optional
 
 from krrood.entity_query_language.symbolic import ResultQuantifier
 from owlrl import DeductiveClosure, OWLRL_Semantics
-from rdflib import Graph
+from rdflib import Graph, Literal
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
 
 from .owl_to_python import OwlToPythonConverter
 
@@ -42,23 +47,162 @@ def generate_lubm_with_predicates():
     converter.save_to_file(output_path)
 
 
-def make_rdf_graph(instances_path: str):
-    g = Graph()
+def make_rdf_graph(instances_path: str, store: str = "default"):
+    """Parse the instances file into an rdflib graph backed by the given store plugin.
+
+    Pass ``store="Oxigraph"`` (requires the optional ``oxrdflib`` package) to have SPARQL
+    joins evaluated natively instead of by rdflib's pure Python evaluator.
+    """
+    g = Graph(store=store)
     g.parse(instances_path)
     return g
 
 
-def evaluate_sparql(rdf_graph: Graph, sparql_queries: List[str]):
-    DeductiveClosure(OWLRL_Semantics, rdfs_closure=True, axiomatic_triples=True).expand(
-        rdf_graph
+def materialize_closure(rdf_graph: Graph) -> Graph:
+    """Expand the graph in place with its OWL-RL closure and return it.
+
+    The RDFS closure also types literals (e.g. ``"x" rdf:type rdfs:Resource``). Triples with
+    a literal subject are not valid RDF and cannot be parsed back from N-Triples, so they
+    are dropped; none of the LUBM queries match them. Stores that reject such triples
+    outright (e.g. Oxigraph) are expanded through an in-memory copy.
+    """
+    closure = DeductiveClosure(
+        OWLRL_Semantics, rdfs_closure=True, axiomatic_triples=True
     )
+    if isinstance(rdf_graph.store, (Memory, SimpleMemory)):
+        closure.expand(rdf_graph)
+        for triple in [t for t in rdf_graph if isinstance(t[0], Literal)]:
+            rdf_graph.remove(triple)
+        return rdf_graph
+    expanded = Graph()
+    expanded += rdf_graph
+    closure.expand(expanded)
+    rdf_graph.addN(
+        (s, p, o, rdf_graph) for s, p, o in expanded if not isinstance(s, Literal)
+    )
+    return rdf_graph
+
+
+def _default_materialized_path(instances_path: str) -> str:
+    return os.path.splitext(instances_path)[0] + "_materialized.nt"
+
+
+def _is_cache_fresh(cache_path: str, source_path: str) -> bool:
+    return os.path.exists(cache_path) and os.path.getmtime(
+        cache_path
+    ) >= os.path.getmtime(source_path)
+
+
+def load_materialized_rdf_graph(
+    instances_path: str, cache_path: Optional[str] = None
+) -> Graph:
+    """Load the instances together with their OWL-RL closure, reasoning at most once.
+
+    The closure is written to ``cache_path`` as N-Triples (next to the instances file by
+    default) and reused on later calls as long as it is newer than the instances file.
+    """
+    if cache_path is None:
+        cache_path = _default_materialized_path(instances_path)
+    if _is_cache_fresh(cache_path, instances_path):
+        g = Graph()
+        g.parse(cache_path, format="nt")
+        return g
+    g = materialize_closure(make_rdf_graph(instances_path))
+    # Write to a temporary file first so an interrupted run never leaves a truncated
+    # cache behind that looks fresh.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".nt.tmp"
+    )
+    os.close(fd)
+    try:
+        g.serialize(destination=tmp_path, format="nt", encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return g
+
+
+@lru_cache(maxsize=None)
+def _prepared_query(query: str):
+    return prepareQuery(query)
+
+
+def _run_query(rdf_graph: Graph, query: str):
+    """Run a query, reusing its parsed algebra when rdflib evaluates it itself.
+
+    Stores with their own SPARQL engine (e.g. Oxigraph) take the query string.
+    """
+    if isinstance(rdf_graph.store, (Memory, SimpleMemory)):
+        return rdf_graph.query(_prepared_query(query))
+    return rdf_graph.query(query)
+
+
+def evaluate_sparql(
+    rdf_graph: Graph, sparql_queries: List[str], materialized: bool = False
+):
+    """Evaluate the queries and return their result counts.
+
+    Set ``materialized`` when the graph already holds its closure, e.g. when it comes
+    from ``load_materialized_rdf_graph``, to skip reasoning.
+    """
+    if not materialized:
+        materialize_closure(rdf_graph)
     counts: List[int] = []
     for q in sparql_queries:
-        res = rdf_graph.query(q)
+        res = _run_query(rdf_graph, q)
         counts.append(len(res))
     return counts
 
 
+# Graph owned by a worker process of ``evaluate_sparql_parallel``.
+_worker_graph: Optional[Graph] = None
+# Error raised while loading that graph, re-raised by the worker's tasks.
+_worker_error: Optional[Exception] = None
+
+
+def _init_sparql_worker(instances_path: str, cache_path: str) -> None:
+    global _worker_graph, _worker_error
+    try:
+        _worker_graph = load_materialized_rdf_graph(instances_path, cache_path)
+    except Exception as e:
+        # An exception escaping an initializer only surfaces as BrokenProcessPool, so keep
+        # it and let the first task report the actual cause.
+        _worker_error = e
+
+
+def _count_sparql(query: str) -> int:
+    if _worker_error is not None:
+        raise _worker_error
+    return len(_run_query(_worker_graph, query))
+
+
+def evaluate_sparql_parallel(
+    instances_path: str,
+    sparql_queries: List[str],
+    cache_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[int]:
+    """Evaluate independent queries concurrently and return their counts in order.
+
+    The closure is materialized once in the calling process; every worker then parses
+    the cached N-Triples file into its own read-only graph. That per-worker parse can
+    outweigh the query time on small datasets, so no more workers than queries are started.
+    """
+    if max_workers is None:
+        max_workers = max(1, min(len(sparql_queries), os.cpu_count() or 1))
+    if cache_path is None:
+        cache_path = _default_materialized_path(instances_path)
+    if not _is_cache_fresh(cache_path, instances_path):
+        load_materialized_rdf_graph(instances_path, cache_path)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_sparql_worker,
+        initargs=(instances_path, cache_path),
+    ) as executor:
+        return list(executor.map(_count_sparql, sparql_queries))
+
+
 def evaluate_eql(
     eql_queries: List[ResultQuantifier],
 ) -> Tuple[List[int], List[List[Any]]]:
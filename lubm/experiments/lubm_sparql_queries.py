@@ -1,7 +1,7 @@
 import os
 import time
 
-from krrood.experiments.helpers import make_rdf_graph, evaluate_sparql
+from krrood.experiments.helpers import load_materialized_rdf_graph, evaluate_sparql
 
 query_1_sparql = """
 PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
@@ -164,9 +164,9 @@ sparql_queries = [
 if __name__ == "__main__":
 
     instances_path = os.path.join("..", "..", "..", "resources", "lubm_instances.owl")
-    graph = make_rdf_graph(instances_path)
+    graph = load_materialized_rdf_graph(instances_path)
     start_time = time.time()
-    counts = evaluate_sparql(graph, sparql_queries)
+    counts = evaluate_sparql(graph, sparql_queries, materialized=True)
     end_time = time.time()
     for i, n in enumerate(counts, 1):
         print(f"{i}:{n}")
@@ -379,6 +379,9 @@ class UniversityDataGenerator:
     ):
         """Assigns advisors and courses to all students."""
 
+        # Faculty publications do not change while students are assigned, so collect them once
+        all_faculty_pubs = [pub for prof in all_professors for pub in prof.publications]
+
         # --- Graduate Student Advisors ---
         # Every graduate-like Student has a Professor as advisor
         for g_student in grad_students:
@@ -396,10 +399,6 @@ class UniversityDataGenerator:
 
             # Graduate-like Student co-authors 0-5 Publications with some Professors
             num_co_pubs = random.randint(0, 5)
-            # Find all faculty publications
-            all_faculty_pubs = [
-                pub for prof in all_professors for pub in prof.publications
-            ]
             if all_faculty_pubs:
                 # Co-author with random selection of existing publications
                 g_student.co_authored_publications.extend(
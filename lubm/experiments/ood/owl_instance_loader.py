@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from SPARQLWrapper import SPARQLWrapper, JSON
+from rdflib import URIRef
 
 import tqdm
 
@@ -22,6 +23,8 @@ from .lubm import (
     ResearchAssistant,
 )
 
+UB = "http://swat.cse.lehigh.edu/onto/univ-bench.owl#"
+
 
 @dataclass
 class _SparqlClient:
@@ -40,17 +43,18 @@ class _SparqlClient:
     graph: Optional[Any] = None
     endpoint: Optional[str] = None
 
-    def select(self, query: str) -> List[Dict[str, str]]:
+    def select(self, query: str, strict: bool = False) -> List[Dict[str, str]]:
         """
         Execute a SPARQL SELECT query and return rows as dictionaries with string values.
+
+        A failing endpoint request yields no rows, or raises ``SparqlQueryError`` when
+        ``strict`` is set.
         """
         if self.graph is not None:
             results = self.graph.query(query)
-            rows: List[Dict[str, str]] = []
-            for row in results:
-                as_dict = row.asdict()
-                rows.append({str(k): str(v) for k, v in as_dict.items()})
-            return rows
+            return [
+                {str(k): str(v) for k, v in row.asdict().items()} for row in results
+            ]
 
         if self.endpoint is not None:
             # type: ignore
@@ -60,18 +64,35 @@ class _SparqlClient:
             sparql.setReturnFormat(JSON)
             try:
                 results = sparql.query().convert()
-            except Exception:
+            except Exception as e:
+                if strict:
+                    raise SparqlQueryError(query) from e
                 return []
-            rows: List[Dict[str, str]] = []
-            for b in results.get("results", {}).get("bindings", []):
-                row: Dict[str, str] = {}
-                for k, v in b.items():
-                    row[k] = v.get("value")
-                rows.append(row)
-            return rows
+            return [
+                {k: v.get("value") for k, v in b.items()}
+                for b in results.get("results", {}).get("bindings", [])
+            ]
 
         return []
 
+    def objects(self, subject: str, predicate: str) -> List[str]:
+        """
+        Return the objects of the single triple pattern ``<subject> <predicate> ?o`` as strings.
+
+        With an in-memory graph the pattern is answered from rdflib's triple index, bypassing
+        SPARQL parsing and algebra evaluation.
+        """
+        if self.graph is not None:
+            return [
+                str(o) for o in self.graph.objects(URIRef(subject), URIRef(predicate))
+            ]
+        rows = self.select(f"SELECT ?o WHERE {{ <{subject}> <{predicate}> ?o }}")
+        return [row["o"] for row in rows]
+
+
+class SparqlQueryError(Exception):
+    """Raised by a strict ``_SparqlClient.select`` when the endpoint request fails."""
+
 
 class DatasetConversionConfigurationError(Exception):
     """Raised when the dataset conversion is misconfigured.
@@ -104,6 +125,11 @@ class DatasetConverter:
     - _course_map: Cache from IRI to ``Course``/``GraduateCourse`` instances.
     - _pub_map: Cache from IRI to ``Publication`` instances.
     - _student_map: Cache from local-name string to ``Student`` instances.
+    - _ta_rows: Cached teaching assistant rows, fetched once per conversion.
+    - _ra_rows: Cached research assistant rows, fetched once per conversion.
+    - _pubs_by_author: Publication IRIs grouped by author IRI, fetched in a single query.
+    - _graduate_course_iris: IRIs of all GraduateCourse instances, fetched once per conversion.
+    - _members_by_department: Student IRIs and graduate flags indexed by department IRI.
     - _client: Internal SPARQL client wrapper.
 
     Methods
@@ -135,6 +161,21 @@ class DatasetConverter:
     _student_map: Dict[Any, Student] = field(
         default_factory=dict, init=False, repr=False
     )
+    _ta_rows: Optional[List[Dict[str, str]]] = field(
+        default=None, init=False, repr=False
+    )
+    _ra_rows: Optional[List[Dict[str, str]]] = field(
+        default=None, init=False, repr=False
+    )
+    _pubs_by_author: Optional[Dict[str, List[str]]] = field(
+        default=None, init=False, repr=False
+    )
+    _graduate_course_iris: Optional[Set[str]] = field(
+        default=None, init=False, repr=False
+    )
+    _members_by_department: Optional[Dict[str, List[tuple[str, bool]]]] = field(
+        default=None, init=False, repr=False
+    )
     _client: _SparqlClient = field(init=False, repr=False, default=None)  # type: ignore
 
     def __post_init__(self) -> None:
@@ -148,7 +189,7 @@ class DatasetConverter:
         """Common SPARQL prefixes used throughout conversion."""
         return (
             "PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>\n"
-            "PREFIX ub: <http://swat.cse.lehigh.edu/onto/univ-bench.owl#>\n"
+            f"PREFIX ub: <{UB}>\n"
         )
 
     def _local_name(self, entity) -> str:
@@ -197,14 +238,33 @@ class DatasetConverter:
         """Execute a SPARQL SELECT query via the configured client."""
         return self._client.select(query)
 
+    def _bulk_select(self, query: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Execute a conversion-wide query whose result the caller caches.
+
+        Returns None when the endpoint request failed, so that callers do not cache an
+        empty result for the whole conversion and retry on their next lookup instead.
+        """
+        try:
+            return self._client.select(query, strict=True)
+        except SparqlQueryError:
+            return None
+
+    def _objects(self, subject_iri: str, predicate: str) -> List[str]:
+        """Objects of a single ``ub:`` property of the given individual."""
+        return self._client.objects(subject_iri, UB + predicate)
+
     def _is_graduate_course_via_sparql(self, course_iri: str) -> bool:
         """Return True if the given course IRI is typed as a GraduateCourse."""
-        q = (
-            self._prefix
-            + f"SELECT ?c WHERE {{ ?c rdf:type ub:GraduateCourse . FILTER(?c = <{course_iri}>) }}"
-        )
-        rows = self._sparql_select(q)
-        return len(rows) > 0
+        # All GraduateCourse instances are fetched once per conversion instead of
+        # asking the source about every course separately.
+        if self._graduate_course_iris is None:
+            q = self._prefix + "SELECT ?c WHERE { ?c rdf:type ub:GraduateCourse }"
+            rows = self._bulk_select(q)
+            if rows is None:
+                return False
+            self._graduate_course_iris = {row["c"] for row in rows}
+        return course_iri in self._graduate_course_iris
 
     # --- Query builders / assemblers (extracted to reduce complexity) ---
 
@@ -260,17 +320,18 @@ class DatasetConverter:
         cached = self._course_map.get(c_iri)
         if cached is not None:
             return cached
+        # Courses are created once per IRI (see _course_map), so a new course cannot be in
+        # the department yet; a list membership test would only run the dataclass __eq__
+        # against every course already there.
         is_grad = self._is_graduate_course_via_sparql(c_iri)
         if is_grad:
             course = GraduateCourse(name=self._local_name(c_iri), department=dept_py)
             self._course_map[c_iri] = course
-            if course not in dept_py.graduate_courses:
-                dept_py.graduate_courses.append(course)  # type: ignore[arg-type]
+            dept_py.graduate_courses.append(course)  # type: ignore[arg-type]
             return course
         course = Course(name=self._local_name(c_iri), department=dept_py)
         self._course_map[c_iri] = course
-        if course not in dept_py.undergraduate_courses:
-            dept_py.undergraduate_courses.append(course)
+        dept_py.undergraduate_courses.append(course)
         return course
 
     def _build_faculty_of_type(
@@ -294,16 +355,11 @@ class DatasetConverter:
                 department=dept_py,
             )
             # Publications
-            pubs_q = (
-                self._prefix
-                + f"SELECT ?p WHERE {{ ?p rdf:type ub:Publication . ?p ub:publicationAuthor <{x_iri}> }}"
-            )
-            for prow in self._sparql_select(pubs_q):
-                role.publications.append(self._get_or_create_publication(prow["p"]))
+            for p_iri in self._publications_of(x_iri):
+                role.publications.append(self._get_or_create_publication(p_iri))
             # Courses taught
-            teach_q = self._prefix + f"SELECT ?c WHERE {{ <{x_iri}> ub:teacherOf ?c }}"
-            for crow in self._sparql_select(teach_q):
-                course = self._course_from_iri(crow["c"], dept_py)
+            for c_iri in self._objects(x_iri, "teacherOf"):
+                course = self._course_from_iri(c_iri, dept_py)
                 if isinstance(course, GraduateCourse):
                     role.teaches_graduate_courses.append(course)
                 else:
@@ -324,24 +380,20 @@ class DatasetConverter:
         rows = self._sparql_select(q)
         if not rows:
             return
-        head_local = self._local_name(rows[0]["h"])
-        for fp in dept_py.full_professors:
-            if fp.person.first_name == head_local:
-                dept_py.head = fp
-                break
+        # Faculty are keyed by IRI when built, so the head is a direct lookup rather
+        # than a scan over the department's full professors comparing local names.
+        head = self._prof_map.get(rows[0]["h"])
+        if isinstance(head, FullProfessor) and head.department is dept_py:
+            dept_py.head = head
 
     def _build_student(self, s_iri: str, is_grad: bool, dept_py: Department) -> Student:
         """Create a Student for the given IRI, attach advisor, courses, and co-authored publications."""
         person = self._build_person(s_iri)
         ug_py_local = None
         if is_grad:
-            q = (
-                self._prefix
-                + f"SELECT ?ug WHERE {{ <{s_iri}> ub:undergraduateDegreeFrom ?ug }}"
-            )
-            rows = self._sparql_select(q)
-            if rows:
-                ug_py_local = self._get_or_create_university(rows[0]["ug"])
+            ug_iris = self._objects(s_iri, "undergraduateDegreeFrom")
+            if ug_iris:
+                ug_py_local = self._get_or_create_university(ug_iris[0])
         student = Student(
             person=person,
             department=dept_py,
@@ -349,30 +401,23 @@ class DatasetConverter:
             undergraduate_degree_from=ug_py_local,
         )
         # Advisor
-        adv_q = self._prefix + f"SELECT ?a WHERE {{ <{s_iri}> ub:advisor ?a }}"
-        adv_rows = self._sparql_select(adv_q)
-        if adv_rows:
-            adv_iri = adv_rows[0]["a"]
-            advisor = self._prof_map.get(adv_iri)
+        adv_iris = self._objects(s_iri, "advisor")
+        if adv_iris:
+            advisor = self._prof_map.get(adv_iris[0])
             if advisor is not None:
                 student.advisor = advisor
                 advisor.advised_students.append(student)
         # Courses
-        take_q = self._prefix + f"SELECT ?c WHERE {{ <{s_iri}> ub:takesCourse ?c }}"
-        for crow in self._sparql_select(take_q):
-            course = self._course_from_iri(crow["c"], dept_py)
+        for c_iri in self._objects(s_iri, "takesCourse"):
+            course = self._course_from_iri(c_iri, dept_py)
             if isinstance(course, GraduateCourse):
                 student.takes_graduate_courses.append(course)
             else:
                 student.takes_courses.append(course)
         # Publications (co-authored)
-        pubs_q = (
-            self._prefix
-            + f"SELECT ?p WHERE {{ ?p rdf:type ub:Publication . ?p ub:publicationAuthor <{s_iri}> }}"
-        )
-        for prow in self._sparql_select(pubs_q):
+        for p_iri in self._publications_of(s_iri):
             student.co_authored_publications.append(
-                self._get_or_create_publication(prow["p"])
+                self._get_or_create_publication(p_iri)
             )
         return student
 
@@ -381,33 +426,89 @@ class DatasetConverter:
     ) -> List[Student]:
         """Create all students for the department identified by the given IRI."""
         students: List[Student] = []
-        grad_q = (
-            self._prefix
-            + f"SELECT ?s WHERE {{ ?s rdf:type ub:GraduateStudent . ?s ub:memberOf <{d_iri}> }}"
-        )
-        for row in self._sparql_select(grad_q):
-            s_iri = row["s"]
-            st = self._build_student(s_iri, True, dept_py)
-            students.append(st)
-            self._student_map[self._local_name(s_iri)] = st
-        ugr_q = (
-            self._prefix
-            + f"SELECT ?s WHERE {{ ?s rdf:type ub:UndergraduateStudent . ?s ub:memberOf <{d_iri}> }}"
-        )
-        for row in self._sparql_select(ugr_q):
-            s_iri = row["s"]
-            st = self._build_student(s_iri, False, dept_py)
+        for s_iri, is_grad in self._members_of(d_iri):
+            st = self._build_student(s_iri, is_grad, dept_py)
             students.append(st)
             self._student_map[self._local_name(s_iri)] = st
         return students
 
+    def _members_of(self, d_iri: str) -> List[tuple[str, bool]]:
+        """
+        Students that are members of the given department as ``(IRI, is_graduate)`` pairs,
+        graduate students first.
+
+        The inverse ``memberOf`` index is built from one query per student type on first
+        use instead of querying every department separately.
+        """
+        if self._members_by_department is None:
+            members_by_department: Dict[str, List[tuple[str, bool]]] = {}
+            for type_name, is_grad in (
+                ("GraduateStudent", True),
+                ("UndergraduateStudent", False),
+            ):
+                q = (
+                    self._prefix
+                    + f"SELECT ?s ?d WHERE {{ ?s rdf:type ub:{type_name} . ?s ub:memberOf ?d }}"
+                )
+                rows = self._bulk_select(q)
+                if rows is None:
+                    return []
+                for row in rows:
+                    members_by_department.setdefault(row["d"], []).append(
+                        (row["s"], is_grad)
+                    )
+            self._members_by_department = members_by_department
+        return self._members_by_department.get(d_iri, [])
+
+    def _publications_of(self, author_iri: str) -> List[str]:
+        """
+        Publication IRIs authored by the given individual.
+
+        All (publication, author) pairs are fetched with one query on first use instead
+        of issuing a query per faculty member and student.
+        """
+        if self._pubs_by_author is None:
+            q = (
+                self._prefix
+                + "SELECT ?p ?a WHERE { ?p rdf:type ub:Publication . ?p ub:publicationAuthor ?a }"
+            )
+            rows = self._bulk_select(q)
+            if rows is None:
+                return []
+            self._pubs_by_author = {}
+            for row in rows:
+                self._pubs_by_author.setdefault(row["a"], []).append(row["p"])
+        return self._pubs_by_author.get(author_iri, [])
+
+    def _teaching_assistant_rows(self) -> List[Dict[str, str]]:
+        """All (TA, course) rows; the query does not depend on the department, so it runs once."""
+        if self._ta_rows is None:
+            q = (
+                self._prefix
+                + "SELECT ?ta ?course WHERE { ?ta rdf:type ub:TeachingAssistant . ?ta ub:teachingAssistantOf ?course }"
+            )
+            rows = self._bulk_select(q)
+            if rows is None:
+                return []
+            self._ta_rows = rows
+        return self._ta_rows
+
+    def _research_assistant_rows(self) -> List[Dict[str, str]]:
+        """All (RA, organization) rows; the query does not depend on the department, so it runs once."""
+        if self._ra_rows is None:
+            q = (
+                self._prefix
+                + "SELECT ?ra ?org WHERE { ?ra rdf:type ub:ResearchAssistant . ?ra ub:worksFor ?org }"
+            )
+            rows = self._bulk_select(q)
+            if rows is None:
+                return []
+            self._ra_rows = rows
+        return self._ra_rows
+
     def _attach_tas(self, dept_py: Department) -> None:
         """Create TeachingAssistant roles for department students assisting its courses."""
-        q = (
-            self._prefix
-            + "SELECT ?ta ?course WHERE { ?ta rdf:type ub:TeachingAssistant . ?ta ub:teachingAssistantOf ?course }"
-        )
-        for row in self._sparql_select(q):
+        for row in self._teaching_assistant_rows():
             course_iri = row["course"]
             course = self._course_map.get(course_iri)
             if course is not None and course.department is dept_py:
@@ -419,13 +520,9 @@ class DatasetConverter:
 
     def _attach_ras(self, dept_py: Department) -> None:
         """Create ResearchAssistant roles for department students working in its research groups."""
-        q = (
-            self._prefix
-            + "SELECT ?ra ?org WHERE { ?ra rdf:type ub:ResearchAssistant . ?ra ub:worksFor ?org }"
-        )
-        for row in self._sparql_select(q):
-            org_local = self._local_name(row["org"])
-            if any(g.name == org_local for g in dept_py.research_groups):
+        group_names = {g.name for g in dept_py.research_groups}
+        for row in self._research_assistant_rows():
+            if self._local_name(row["org"]) in group_names:
                 st = self._student_map.get(self._local_name(row["ra"]))
                 if st is not None:
                     _ = ResearchAssistant(graduate_student=st)
@@ -444,6 +541,13 @@ class DatasetConverter:
         This orchestration delegates cohesive tasks to dedicated methods,
         lowering cyclomatic complexity while preserving behavior.
         """
+        # Drop rows cached by a previous run; the source may have changed since.
+        self._ta_rows = None
+        self._ra_rows = None
+        self._pubs_by_author = None
+        self._graduate_course_iris = None
+        self._members_by_department = None
+
         # 1) Universities
         uni_rows = self._sparql_select(
             self._prefix + "SELECT ?u WHERE { ?u rdf:type ub:University }"
@@ -483,7 +587,9 @@ class DatasetConverter:
                 self._attach_tas(dept_py)
                 self._attach_ras(dept_py)
 
-                if dept_py not in u_py.departments:
+                # Identity test: a Department's dataclass __eq__ would compare all of its
+                # members, and a repeated convert() returns the same cached objects.
+                if not any(d is dept_py for d in u_py.departments):
                     u_py.departments.append(dept_py)
 
         return list(self._uni_map.values())
@@ -202,6 +202,19 @@ def load_instances(
     def descriptor_base_for(pred_local: str) -> Optional[Type]:
         return descriptor_by_name.get(to_pascal(pred_local))
 
+    # Dataclass field types per model class, resolved once instead of per literal triple
+    field_types_by_class: Dict[Type, Dict[str, Any]] = {}
+
+    def field_types_for(cls: Type) -> Dict[str, Any]:
+        ftypes = field_types_by_class.get(cls)
+        if ftypes is None:
+            try:
+                ftypes = {f.name: f.type for f in fields(cls)}
+            except TypeError:
+                ftypes = {}
+            field_types_by_class[cls] = ftypes
+        return ftypes
+
     # Assign properties
     for s, p, o in g:
         if p == RDF.type:
@@ -223,10 +236,7 @@ def load_instances(
         if isinstance(o, Literal):
             if field_name and hasattr(subj, field_name):
                 # Coerce to field annotated type
-                try:
-                    ftypes = {f.name: f.type for f in fields(subj_cls)}
-                except TypeError:
-                    ftypes = {}
+                ftypes = field_types_for(subj_cls)
                 coerced = _coerce_literal(o, ftypes.get(field_name))
                 setattr(subj, field_name, coerced)
             # else: ignore literals not present in model
@@ -27,11 +27,12 @@ from krrood.experiments.ood.queries import (
 
 
 def evaluate_query(query):
+    """Evaluate the query and return the number of results with the elapsed time."""
     start_time = time.time()
-    result = list(query.evaluate())
+    count = sum(1 for _ in query.evaluate())
     end_time = time.time()
     elapsed_time = end_time - start_time
-    return result, elapsed_time
+    return count, elapsed_time
 
 
 def evaluate_eql():
@@ -70,10 +71,10 @@ def evaluate_eql():
     for index, query in enumerate(tqdm.tqdm(queries)):
         current_query_times = []
         for i in range(1):
-            result, elapsed_time = evaluate_query(query)
+            count, elapsed_time = evaluate_query(query)
             current_query_times.append(elapsed_time)
         query_times[f"query_{index+1}"] = current_query_times
-        print("query", index + 1, "returned", len(result), "results")
+        print("query", index + 1, "returned", count, "results")
     print(query_times)
     print(
         "Average Query times",
@@ -22,6 +22,6 @@ if __name__ == "__main__":
     counts = []
     for q in sparql_queries:
         res = graph.query(q)
-        counts.append(len(list(res)))
+        counts.append(len(res))
 
     print(counts)
@@ -29,42 +29,48 @@ def run_query(query, query_name):
     return results, elapsed
 
 
-path_to_ontologies = os.path.join(
-    os.path.dirname(__file__), "..", "resources", "instances"
-)
-#
-# graph = Graph()
-#
-# for f in os.listdir(path_to_ontologies):
-#     if f.endswith(".owl"):
-#         graph.parse(os.path.join(path_to_ontologies, f), format="xml")
-
-path_to_answers = os.path.join(path_to_ontologies, "..", "query_answers")
-
-query_times = {}
-
-for answer_file, query in zip(
-    sorted(
-        os.listdir(path_to_answers), key=lambda x: int("".join(filter(str.isdigit, x)))
-    ),
-    krrood.experiments.lubm_sparql_queries.sparql_queries,
-):
-
-    answer_file_full_path = os.path.join(path_to_answers, answer_file)
-    with open(answer_file_full_path, "r") as f:
-        lines = f.readlines()
-        row_count = len([line for line in lines if line.strip()])
-
-    current_query_times = []
-    for i in range(10):
-        answers_in_memory, elapsed = run_query(query, answer_file)
-        current_query_times.append(elapsed)
-
-    answers_in_memory_count = len(answers_in_memory["results"]["bindings"])
-    assert (
-        answers_in_memory_count == row_count - 1
-    ), f"{answer_file} has {row_count} answers, SPARQLWrapper got {answers_in_memory_count} answers"
-
-    query_times[answer_file] = current_query_times
-
-print("Average Query times", {k: np.mean(v) for k, v in query_times.items()})
+def main():
+    path_to_ontologies = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "instances"
+    )
+    #
+    # graph = Graph()
+    #
+    # for f in os.listdir(path_to_ontologies):
+    #     if f.endswith(".owl"):
+    #         graph.parse(os.path.join(path_to_ontologies, f), format="xml")
+
+    path_to_answers = os.path.join(path_to_ontologies, "..", "query_answers")
+
+    query_times = {}
+
+    for answer_file, query in zip(
+        sorted(
+            os.listdir(path_to_answers),
+            key=lambda x: int("".join(filter(str.isdigit, x))),
+        ),
+        krrood.experiments.lubm_sparql_queries.sparql_queries,
+    ):
+
+        answer_file_full_path = os.path.join(path_to_answers, answer_file)
+        with open(answer_file_full_path, "r") as f:
+            lines = f.readlines()
+            row_count = len([line for line in lines if line.strip()])
+
+        current_query_times = []
+        for i in range(10):
+            answers_in_memory, elapsed = run_query(query, answer_file)
+            current_query_times.append(elapsed)
+
+        answers_in_memory_count = len(answers_in_memory["results"]["bindings"])
+        assert (
+            answers_in_memory_count == row_count - 1
+        ), f"{answer_file} has {row_count} answers, SPARQLWrapper got {answers_in_memory_count} answers"
+
+        query_times[answer_file] = current_query_times
+
+    print("Average Query times", {k: np.mean(v) for k, v in query_times.items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -23,3 +23,72 @@ def test_owl_instance_loader():
         )
 
     print(len(list(query.evaluate())))
+
+
+def test_dataset_converter_from_in_memory_graph():
+    instances_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "resources",
+        "instances",
+        "University0_0.owl",
+    )
+    converter = DatasetConverter(sparql_graph=Graph().parse(instances_path))
+    universities = converter.convert()
+
+    # University0 plus every university referenced as a degree source
+    assert len(universities) == 237
+    university = next(u for u in universities if u.name == "www.University0.edu")
+    assert len(university.departments) == 1
+
+    department = university.departments[0]
+    assert department.name == "www.Department0.University0.edu"
+    assert len(department.full_professors) == 10
+    assert len(department.associate_professors) == 14
+    assert len(department.assistant_professors) == 10
+    assert len(department.lecturers) == 7
+    assert department.head is not None
+    assert department.head.person.first_name == "FullProfessor7"
+
+    # memberOf index and triple-API lookups (advisor, takesCourse, degrees)
+    assert len(department.students) == 678
+    assert sum(1 for s in department.students if s.advisor is not None) == 255
+    assert (
+        sum(1 for s in department.students if s.undergraduate_degree_from is not None)
+        == 146
+    )
+
+    # GraduateCourse extent versus plain courses reached via teacherOf/takesCourse
+    assert len(department.graduate_courses) == 67
+    assert len(department.undergraduate_courses) == 61
+
+    # Bulk publicationAuthor lookup
+    full_professor_0 = next(
+        p for p in department.full_professors if p.person.first_name == "FullProfessor0"
+    )
+    assert len(full_professor_0.publications) == 16
+
+    # Converting again reuses the cached organizations without duplicating them
+    converter.convert()
+    assert len(university.departments) == 1
+
+
+def test_dataset_converter_does_not_cache_failed_endpoint_queries():
+    # Nothing listens on port 9, so every endpoint request fails.
+    converter = DatasetConverter(sparql_endpoint="http://localhost:9/unreachable")
+
+    assert converter._teaching_assistant_rows() == []
+    assert converter._research_assistant_rows() == []
+    assert converter._publications_of("http://www.University0.edu/Author") == []
+    assert converter._members_of("http://www.Department0.University0.edu") == []
+    assert not converter._is_graduate_course_via_sparql(
+        "http://www.Department0.University0.edu/GraduateCourse0"
+    )
+
+    # Failed lookups leave the caches empty, so the next lookup queries again.
+    assert converter._ta_rows is None
+    assert converter._ra_rows is None
+    assert converter._pubs_by_author is None
+    assert converter._members_by_department is None
+    assert converter._graduate_course_iris is None
@@ -2,8 +2,17 @@ from __future__ import annotations
 
 import os
 
-from krrood.experiments import lubm_with_predicates
-from krrood.experiments.helpers import evaluate_sparql, make_rdf_graph
+import pytest
+from rdflib.exceptions import ParserError
+
+from krrood.experiments import helpers, lubm_with_predicates
+from krrood.experiments.helpers import (
+    _prepared_query,
+    evaluate_sparql,
+    evaluate_sparql_parallel,
+    load_materialized_rdf_graph,
+    make_rdf_graph,
+)
 from krrood.experiments.lubm_sparql_queries import sparql_queries
 from krrood.experiments.lubm_eql_queries import evaluate_eql, get_eql_queries
 from krrood.experiments.owl_instances_loader import load_instances
@@ -23,3 +32,80 @@ def test_eql_counts_match_sparql():
 
     # test only the first query for now as the queries of sparql are not correct yet.
     assert actual[0] == expected[0]
+
+
+def test_materialized_graph_cache_matches_reasoning(tmp_path, monkeypatch):
+    instances_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "resources", "lubm_instances.owl"
+    )
+    cache_path = str(tmp_path / "lubm_instances_materialized.nt")
+
+    expected = evaluate_sparql(make_rdf_graph(instances_path), sparql_queries)
+
+    # First call reasons and writes the cache, second call must only parse it.
+    load_materialized_rdf_graph(instances_path, cache_path)
+
+    def fail_if_reasoning(rdf_graph):
+        raise AssertionError("cached closure was not reused")
+
+    monkeypatch.setattr(helpers, "materialize_closure", fail_if_reasoning)
+    cached_graph = load_materialized_rdf_graph(instances_path, cache_path)
+    actual = evaluate_sparql(cached_graph, sparql_queries, materialized=True)
+
+    assert actual == expected
+
+
+def test_parallel_sparql_counts_match_sequential(tmp_path):
+    instances_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "resources", "lubm_instances.owl"
+    )
+    cache_path = str(tmp_path / "lubm_instances_materialized.nt")
+
+    expected = evaluate_sparql(make_rdf_graph(instances_path), sparql_queries)
+    actual = evaluate_sparql_parallel(
+        instances_path, sparql_queries, cache_path=cache_path, max_workers=2
+    )
+
+    assert actual == expected
+
+
+def test_evaluate_sparql_reuses_prepared_queries():
+    instances_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "resources", "lubm_instances.owl"
+    )
+    rdf_graph = make_rdf_graph(instances_path)
+    _prepared_query.cache_clear()
+
+    first = evaluate_sparql(rdf_graph, sparql_queries)
+    second = evaluate_sparql(rdf_graph, sparql_queries, materialized=True)
+
+    assert first == second
+    assert _prepared_query.cache_info().hits >= len(sparql_queries)
+
+
+def test_parallel_sparql_reports_worker_load_errors(tmp_path):
+    instances_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "resources", "lubm_instances.owl"
+    )
+    cache_path = tmp_path / "lubm_instances_materialized.nt"
+    # A fresh but unreadable cache makes every worker fail while loading it.
+    cache_path.write_text("not n-triples\n")
+
+    with pytest.raises(ParserError):
+        evaluate_sparql_parallel(
+            instances_path, sparql_queries[:1], cache_path=str(cache_path)
+        )
+
+
+def test_oxigraph_store_counts_match_memory_store():
+    pytest.importorskip("oxrdflib")
+    instances_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "resources", "lubm_instances.owl"
+    )
+
+    expected = evaluate_sparql(make_rdf_graph(instances_path), sparql_queries)
+    actual = evaluate_sparql(
+        make_rdf_graph(instances_path, store="Oxigraph"), sparql_queries
+    )
+
+    assert actual == expected